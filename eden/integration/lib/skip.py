@@ -6,10 +6,18 @@
 
 import os
 import sys
-import unittest
-from typing import Dict, List, Union
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Union
 
 
+if TYPE_CHECKING:
+    import unittest
+
+
+_IS_WIN: bool = sys.platform == "win32"
+_IS_LINUX: bool = sys.platform.startswith("linux")
+# Only stat /etc/redhat-release when it can actually matter.
+_IS_RHEL: bool = _IS_LINUX and os.path.exists("/etc/redhat-release")
+
 #
 # Disabled tests definitions.
 # This is a dictionary of class names. For each class the value can be set to True to
@@ -19,7 +27,7 @@ from typing import Dict, List, Union
 # should gradually remove tests from this list as we get them passing on Windows.
 #
 TEST_DISABLED: Dict[str, Union[List[str], bool]] = {}
-if sys.platform == "win32":
+if _IS_WIN:
     # Note that on Windows we also exclude some test source files entirely
     # in CMakeLists.txt, for tests that never make sense to run on Windows.
     TEST_DISABLED: Dict[str, Union[List[str], None]] = {
@@ -130,7 +138,7 @@ if sys.platform == "win32":
         ],
         "stale_inode_test.StaleInodeTestHgNFS": True,
     }
-elif sys.platform.startswith("linux") and not os.path.exists("/etc/redhat-release"):
+elif _IS_LINUX and not _IS_RHEL:
     # The ChownTest.setUp() code tries to look up the "nobody" group, which doesn't
     # exist on Ubuntu.
     TEST_DISABLED["chown_test.ChownTest"] = True
@@ -151,11 +159,11 @@ elif sys.platform.startswith("linux") and not os.path.exists("/etc/redhat-releas
     ]
 
 # Windows specific tests
-if sys.platform != "win32":
+if not _IS_WIN:
     TEST_DISABLED["windows_fsck_test.WindowsFsckTest"] = True
 
 # We only run tests on linux currently, so we only need to disable them there.
-if sys.platform.startswith("linux"):
+if _IS_LINUX:
     # tests to skip on nfs, this list allows us to avoid writing the nfs postfix
     # on the test and disables them for both Hg and Git as nfs tests generally
     # fail for both if they fail.
@@ -180,9 +188,13 @@ if sys.platform.startswith("linux"):
         ],
     }
 
-    for (testModule, disabled) in NFS_TEST_DISABLED.items():
-        for vcs in ["Hg", "Git"]:
-            TEST_DISABLED[testModule + "NFS" + vcs] = disabled
+    TEST_DISABLED.update(
+        {
+            f"{testModule}NFS{vcs}": disabled
+            for (testModule, disabled) in NFS_TEST_DISABLED.items()
+            for vcs in ("Hg", "Git")
+        }
+    )
 
     # custom nfs tests that don't run on both hg and git that we also need to
     # disable
@@ -206,33 +218,68 @@ if sys.platform.startswith("linux"):
         }
     )
 
-try:
-    from eden.integration.facebook.lib.skip import add_fb_specific_skips
 
-    add_fb_specific_skips(TEST_DISABLED)
-except ImportError:
-    pass
+# Strip off the leading "eden.integration." prefix from the module name just
+# to make our skipped names shorter and easier to read/maintain.
+_STRIP_PREFIX = "eden.integration."
+
+
+def _normalize_disabled(
+    disabled: Dict[str, Union[List[str], bool]]
+) -> Dict[str, Union[FrozenSet[str], bool]]:
+    """Build the lookup table used by _is_disabled().
+
+    Every class is registered both with and without the "eden.integration."
+    prefix so that a single lookup on the fully qualified class name suffices,
+    and lists of test methods are converted to frozensets.
+    """
+    result: Dict[str, Union[FrozenSet[str], bool]] = {}
+    for (name, skipped) in disabled.items():
+        if name.startswith(_STRIP_PREFIX):
+            name = name[len(_STRIP_PREFIX) :]
+        value = skipped if isinstance(skipped, bool) else frozenset(skipped)
+        result[name] = value
+        result[_STRIP_PREFIX + name] = value
+    return result
 
 
-def skip_if_disabled(test_case: unittest.TestCase) -> None:
+# Lazily built by _get_disabled() on the first skip check, so that importing
+# this module does not pull in the facebook-specific skip list.
+_DISABLED_NORMALIZED: Optional[Dict[str, Union[FrozenSet[str], bool]]] = None
+
+
+def _get_disabled() -> Dict[str, Union[FrozenSet[str], bool]]:
+    global _DISABLED_NORMALIZED
+    if _DISABLED_NORMALIZED is None:
+        try:
+            from eden.integration.facebook.lib.skip import add_fb_specific_skips
+
+            add_fb_specific_skips(TEST_DISABLED)
+        except ImportError:
+            pass
+        _DISABLED_NORMALIZED = _normalize_disabled(TEST_DISABLED)
+    return _DISABLED_NORMALIZED
+
+
+_RUN_DISABLED: bool = os.environ.get("EDEN_RUN_DISABLED_TESTS", "") == "1"
+
+
+def skip_if_disabled(test_case: "unittest.TestCase") -> None:
     if _is_disabled(test_case):
+        import unittest
+
         raise unittest.SkipTest("this test is currently unsupported on this platform")
 
 
-def _is_disabled(test_case: unittest.TestCase) -> bool:
-    if not TEST_DISABLED:
+def _is_disabled(test_case: "unittest.TestCase") -> bool:
+    if _RUN_DISABLED:
         return False
-    if os.environ.get("EDEN_RUN_DISABLED_TESTS", "") == "1":
+    disabled = _get_disabled()
+    if not disabled:
         return False
 
-    class_name = f"{type(test_case).__module__}.{type(test_case).__name__}"
-    # Strip off the leading "eden.integration." prefix from the module name just
-    # to make our skipped names shorter and easier to read/maintain.
-    strip_prefix = "eden.integration."
-    if class_name.startswith(strip_prefix):
-        class_name = class_name[len(strip_prefix) :]
-
-    class_skipped = TEST_DISABLED.get(class_name)
+    cls = type(test_case)
+    class_skipped = disabled.get("".join((cls.__module__, ".", cls.__name__)))
     if class_skipped is None:
         return False
     if isinstance(class_skipped, bool):